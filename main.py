@@ -42,6 +42,7 @@ if __name__ == "__main__":
     _print_args(args)
 
     constructor = GeneralConstructor(env_configs=env_configs)
+    subtitle_extractor = GeneralSubtitleExtractor(constrcutor=constructor)
     log_exporter = LogExporter()
 
     handler = Handler(
@@ -52,14 +53,17 @@ if __name__ == "__main__":
         media_analyzer_factory=MediaAnalyzerFactory(env_configs=env_configs),
         restructor_factory=RestructorFactory(
             env_configs=env_configs,
-            subtitle_extractor=GeneralSubtitleExtractor(constrcutor=constructor),
+            subtitle_extractor=subtitle_extractor,
         ),
         executor=GeneralExecutor(log_exporter=log_exporter),
         log_exporter=log_exporter,
     )
 
-    handler.process(
-        source_path=args.source_path,
-        target_path=args.target_path,
-        multiple=args.multiple == "True",
-    )
+    try:
+        handler.process(
+            source_path=args.source_path,
+            target_path=args.target_path,
+            multiple=args.multiple == "True",
+        )
+    finally:
+        subtitle_extractor.close()
@@ -1,7 +1,10 @@
+import os
 import re
+import bisect
 import itertools
+import operator
 from abc import ABCMeta
-from typing import List, Optional
+from typing import Iterator, List, Optional
 from loguru import logger
 
 from src.model.file import File
@@ -16,28 +19,27 @@ from src.analyzer.metadata_builder import (
 from src.analyzer.error import (
     MediaRootNotFoundException,
     EpisodeIndexNotFoundException,
-    EpisodeIndexDuplicatedException,
     SeasonIndexNotFoundException,
 )
 from src.constants import MediaType, FileType, SeasonAlias
 from src.env_configs import EnvConfigs
 
 
-# TODO: regex 적용 필요
+_NUM_RE = re.compile(r"[0-9]+")
+_SEASON_RE = re.compile(
+    "|".join(re.escape(alias) for alias in SeasonAlias.SEASON_ALIASES), re.IGNORECASE
+)
+_SPECIAL_CHAR_TRANS = str.maketrans({"_": " ", ".": " "})
+
+
 def find_season_keyword(str: str) -> Optional[str]:
-    for alias in SeasonAlias.SEASON_ALIASES:
-        if alias in str.lower():
-            return alias
-    return None
+    matched = _SEASON_RE.search(str)
+    return matched.group().lower() if matched else None
 
 
 def _extract_number_from_string(str: str) -> Optional[int]:
-    for i in re.finditer(r"[0-9]+", str):
-        str_index = i.group()
-        if str_index.isnumeric():
-            return int(str_index)
-
-    return None
+    matched = _NUM_RE.search(str)
+    return int(matched.group()) if matched else None
 
 
 def _extract_season_number_from_string(str: str, season_keyword: str) -> Optional[int]:
@@ -59,9 +61,7 @@ def extract_season_index(folder_name: str) -> Optional[int]:
 
 
 def replace_special_chars(str: str) -> str:
-    underscore_replaced = str.replace("_", " ")
-    dot_replaced = underscore_replaced.replace(".", " ")
-    return dot_replaced
+    return str.translate(_SPECIAL_CHAR_TRANS)
 
 
 class MediaAnalyzer(metaclass=ABCMeta):
@@ -78,6 +78,7 @@ class MediaAnalyzer(metaclass=ABCMeta):
 class GeneralMediaAnalyzer(MediaAnalyzer):
     def __init__(self, env_configs: EnvConfigs) -> None:
         self._env_configs = env_configs
+        self._scanned_folders: dict[int, tuple[List[File], List[File]]] = {}
 
     def _get_builder(self):
         raise NotImplementedError
@@ -90,6 +91,8 @@ class GeneralMediaAnalyzer(MediaAnalyzer):
         return builder.build()
 
     def _analyze(self, builder: MetadataBuilder, root: Folder) -> None:
+        self._scanned_folders = {}
+
         builder.set_root(root=root)
         builder.set_title(root.get_title())
 
@@ -100,28 +103,45 @@ class GeneralMediaAnalyzer(MediaAnalyzer):
     def _find_media_root(self, root: Folder) -> Folder:
         raise NotImplementedError
 
-    def _get_media_files(self, root: Folder) -> List[File]:
+    # split files of folder into (media files, subtitles), walking them once per pass
+    def _scan_folder(self, folder: Folder) -> tuple[List[File], List[File]]:
+        folder_id = id(folder)
+        if folder_id in self._scanned_folders:
+            return self._scanned_folders[folder_id]
+
         media_files = []
-        for file in root.get_files():
-            if file.get_file_type() == FileType.MEDIA:
+        subtitles = []
+
+        for file in folder.get_files():
+            file_type = file.get_file_type()
+            if file_type == FileType.MEDIA:
                 media_files.append(file)
+            elif file_type in (FileType.SUBTITLE, FileType.ARCHIVED_SUBTITLE):
+                subtitles.append(file)
+
+        self._scanned_folders[folder_id] = (media_files, subtitles)
+        return media_files, subtitles
 
-        if not media_files:
-            for child in root.get_folders():
-                media_files.extend(self._get_media_files(child))
+    # yield media files of the shallowest media containing folder in each branch
+    def _iter_media_files(self, root: Folder) -> Iterator[File]:
+        folders = [root]
 
-        return media_files
+        while folders:
+            folder = folders.pop()
+            folder_media_files, _ = self._scan_folder(folder=folder)
+            if folder_media_files:
+                yield from folder_media_files
+                continue
+
+            folders.extend(reversed(folder.get_folders()))
+
+    def _get_media_files(self, root: Folder) -> List[File]:
+        return list(self._iter_media_files(root=root))
 
     # TODO: folder 내에 여러 자막이 있는 경우, 여러 파일 설정 필요
     def _get_subtitle_file(self, folder: Folder) -> List[Structable]:
-        subtitles = []
-
-        for file in folder.get_files():
-            if file.get_file_type() in (
-                FileType.SUBTITLE,
-                FileType.ARCHIVED_SUBTITLE,
-            ):
-                subtitles.append(file)
+        _, subtitles = self._scan_folder(folder=folder)
+        subtitles = list(subtitles)
 
         if len(subtitles) == 0:
             logger.warning(
@@ -175,11 +195,14 @@ class TVAnalyzer(GeneralMediaAnalyzer):
     def __init__(self, env_configs: EnvConfigs) -> None:
         super().__init__(env_configs)
         self._media_type = MediaType.TV
+        self._season_keywords: dict[int, Optional[str]] = {}
 
     def _get_builder(self):
         return TVMetadataBuilder()
 
     def _analyze(self, builder: TVMetadataBuilder, root: Folder) -> None:
+        self._season_keywords = {}
+
         super()._analyze(builder, root)
 
         seasons = self._analyze_season(
@@ -192,7 +215,7 @@ class TVAnalyzer(GeneralMediaAnalyzer):
 
         for folder in root.get_folders():
             if folder.get_number_of_files_by_type(file_type=FileType.MEDIA) > 0 or (
-                find_season_keyword(folder.get_title())
+                self._find_season_keyword(folder=folder)
             ):
                 media_contained_folder.append(folder)
 
@@ -205,11 +228,18 @@ class TVAnalyzer(GeneralMediaAnalyzer):
         season_folders = []
 
         for folder in root.get_folders():
-            if find_season_keyword(folder.get_title()):
+            if self._find_season_keyword(folder=folder):
                 season_folders.append(folder)
 
         return season_folders
 
+    # folders are visited by both _find_media_root and _find_season_folders
+    def _find_season_keyword(self, folder: Folder) -> Optional[str]:
+        folder_id = id(folder)
+        if folder_id not in self._season_keywords:
+            self._season_keywords[folder_id] = find_season_keyword(folder.get_title())
+        return self._season_keywords[folder_id]
+
     def _analyze_season(
         self, builder: TVMetadataBuilder, media_root: Folder, root: Folder
     ) -> dict[int, SeasonMetadata]:
@@ -271,80 +301,85 @@ class TVAnalyzer(GeneralMediaAnalyzer):
     def _get_episodes(self, media_files: List[File]) -> dict[int, File]:
         episodes = {}
 
-        sorted(media_files, key=lambda file: file.get_title())
+        titled_files = sorted(
+            ((media_file.get_title(), media_file) for media_file in media_files),
+            key=operator.itemgetter(0),
+        )
 
         episode_index_not_found_files = []
 
-        file_name_prefix = self._get_file_name_prefix(files=media_files)
+        file_titles = [file_title for file_title, _ in titled_files]
 
-        for media_file in media_files:
-            file_title = media_file.get_title()
+        file_name_prefix = self._get_file_name_prefix(file_names=file_titles)
+        episode_indexes = self._match_episode_indexes(
+            file_names=file_titles,
+            pattern=self._compile_episode_index_pattern(prefix=file_name_prefix),
+        )
 
-            try:
-                episode_index = self._extract_episode_index_from_file_name(
-                    file_name=file_title, prefix=file_name_prefix
-                )
-            except EpisodeIndexNotFoundException:
+        for position, (file_title, media_file) in enumerate(titled_files):
+            episode_index = episode_indexes.get(position)
+            if episode_index is None:
                 logger.info(f"Episode index not found from {file_title}")
                 episode_index_not_found_files.append(media_file)
                 continue
 
-            if episodes.get(episode_index, None):
+            if episode_index in episodes:
                 logger.info(f"Duplicated episode index found from {file_title}")
                 episode_index_not_found_files.append(media_file)
                 continue
 
-            if episodes.get(episode_index):
-                raise EpisodeIndexDuplicatedException("Duplicated episode index found")
-
             episodes[episode_index] = media_file
 
         return episodes
 
-    def _get_file_name_prefix(self, files: List[File]) -> str:
-        file_names = [file.get_title() for file in files]
+    def _get_file_name_prefix(self, file_names: List[str]) -> str:
         if len(file_names) <= 1:
             return ""
 
-        res = "".join(
-            c[0]
-            for c in itertools.takewhile(
-                lambda x: all(x[0] == y for y in x), zip(*file_names)
-            )
-        )
+        res = os.path.commonprefix(file_names)
+
+        # prefix must stop before the episode number, not in the middle of it
+        prefix_length = len(res)
+        if res[-1:].isdigit() and any(
+            file_name[prefix_length : prefix_length + 1].isdigit()
+            for file_name in file_names
+        ):
+            res = res.rstrip("0123456789")
 
         if not res:
             logger.warning(f"Failed to found file prefix from file name")
         return res
 
-    def _extract_episode_index_from_file_name(self, file_name: str, prefix: str) -> int:
-        prefix_removed = file_name.replace(prefix, "")
-
-        # try to split by episode spliter
-        index = self._extract_episode_index_from_normalized_form(str=prefix_removed)
-        if index:
-            return index
-
-        for numeric_span in re.finditer(r"\d+", prefix_removed):
-            str_index = numeric_span.group()
-
-            if str_index.isnumeric():
-                return int(str_index)
-
-        raise EpisodeIndexNotFoundException
-
-    def _extract_episode_index_from_normalized_form(self, str: str) -> Optional[int]:
-        try:
-            for i in re.finditer(r"S[0-9]+E[0-9]+", str):
-                str_episode = i.group()
-                splited = str_episode.split("E")[1]
+    # after prefix, prefer normalized form (S00E00) over the first number
+    def _compile_episode_index_pattern(self, prefix: str) -> re.Pattern:
+        return re.compile(
+            rf"^{re.escape(prefix)}(?:.*?S[0-9]+E([0-9]+)|[^0-9\n]*([0-9]+))",
+            re.IGNORECASE | re.MULTILINE,
+        )
 
-                if splited.isnumeric():
-                    return int(splited)
+    def _match_episode_index(self, file_name: str, pattern: re.Pattern) -> int:
+        matched = pattern.match(file_name)
+        if not matched:
+            raise EpisodeIndexNotFoundException
+
+        return int(matched.group(1) or matched.group(2))
+
+    # match all file names in one pass over a newline joined buffer,
+    # returns episode index by position of file name
+    def _match_episode_indexes(
+        self, file_names: List[str], pattern: re.Pattern
+    ) -> dict[int, int]:
+        file_name_offsets = list(
+            itertools.accumulate(
+                (len(file_name) + 1 for file_name in file_names), initial=0
+            )
+        )
 
-        except Exception as e:
-            logger.warning(
-                f"Failed to extract episode index from normalized form (format : S00E00) : {e}"
+        episode_indexes = {}
+        for matched in pattern.finditer("\n".join(file_names)):
+            position = bisect.bisect_right(file_name_offsets, matched.start()) - 1
+            episode_indexes.setdefault(
+                position, int(matched.group(1) or matched.group(2))
             )
 
-        return None
+        return episode_indexes
@@ -14,16 +14,17 @@ from src.env_configs import EnvConfigs
 # License of this code inherits the original repo's license. (g6123, ncianeo)
 
 
+_LANGUAGE_SUFFIX_RE = re.compile(r"[^0-9]+")
+
+
 def trunc_suffix_from_file_name(file_name: str) -> str:
-    splited = file_name.split(".")
+    file_name_body, dot, suffix = file_name.rpartition(".")
 
-    if len(splited) <= 1:
+    if not dot:
         return file_name
 
-    suffix = splited[-1]
-
-    if len(suffix) == 2 and re.compile("[^0-9]+").match(suffix):
-        return file_name[:-3]
+    if len(suffix) == 2 and _LANGUAGE_SUFFIX_RE.match(suffix):
+        return file_name_body
     return file_name
 
 
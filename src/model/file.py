@@ -9,6 +9,8 @@ def extract_extension(absolute_path: str) -> str:
 
 
 class File(Structable):
+    __slots__ = ("_title", "_absolute_path", "_extension", "_file_type")
+
     def __init__(self, absolute_path: str, file_type: FileType) -> None:
         self._title = self._extract_title(absolute_path=absolute_path)
         self._absolute_path = absolute_path
@@ -36,6 +38,8 @@ class File(Structable):
 
 
 class RestructedFile(File):
+    __slots__ = ("_original_file", "_copied")
+
     def __init__(
         self, absolute_path: str, original_file: File, copied: bool = False
     ) -> None:
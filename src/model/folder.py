@@ -6,10 +6,21 @@ from src.model.file import File, FileType
 
 
 class Folder(Structable):
+    __slots__ = (
+        "_title",
+        "_absolute_path",
+        "_structs",
+        "_files",
+        "_folders",
+        "_number_of_files_by_type",
+    )
+
     def __init__(self, absolute_path: str) -> None:
         self._title = self._extract_title(absolute_path=absolute_path)
         self._absolute_path = absolute_path
         self._structs = []
+        self._files = []
+        self._folders = []
         self._number_of_files_by_type = {}
 
     def _extract_title(self, absolute_path: str) -> str:
@@ -26,16 +37,19 @@ class Folder(Structable):
             self._number_of_files_by_type[struct.get_file_type()] = (
                 self._number_of_files_by_type.get(struct.get_file_type(), 0) + 1
             )
+            self._files.append(struct)
+        elif isinstance(struct, Folder):
+            self._folders.append(struct)
         self._structs.append(struct)
 
     def get_structs(self) -> List[Structable]:
         return self._structs
 
     def get_files(self) -> List[File]:
-        return [x for x in self._structs if isinstance(x, File)]
+        return self._files
 
     def get_folders(self) -> List:
-        return [x for x in self._structs if isinstance(x, Folder)]
+        return self._folders
 
     def get_number_of_files_by_type(self, file_type: FileType) -> int:
         return self._number_of_files_by_type.get(file_type, 0)
@@ -50,6 +64,8 @@ class Folder(Structable):
 
 
 class RestructedFolder(Folder):
+    __slots__ = ("_original_folder",)
+
     def __init__(self, absolute_path: str, original_folder: Folder) -> None:
         super().__init__(absolute_path)
         self._original_folder = original_folder
@@ -4,6 +4,8 @@ from abc import ABCMeta
 
 
 class Structable(metaclass=ABCMeta):
+    __slots__ = ()
+
     def _extract_title(self, absolute_path: str) -> str:
         raise NotImplementedError
 
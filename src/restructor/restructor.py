@@ -2,8 +2,9 @@ import os
 import tempfile
 import shutil
 from abc import ABCMeta
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from loguru import logger
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 from src.model.structable import Structable
 from src.model.file import File, RestructedFile
@@ -114,6 +115,7 @@ class GeneralRestructor(Restructor):
         self,
         subtitle_struct: Structable,
         metadata: Metadata,
+        extracted_folder: Optional[Folder] = None,
     ) -> List[File]:
         subtitle_files = []
 
@@ -121,9 +123,12 @@ class GeneralRestructor(Restructor):
             if subtitle_struct.get_file_type() == FileType.SUBTITLE:
                 subtitle_files = [subtitle_struct]
             elif subtitle_struct.get_file_type() == FileType.ARCHIVED_SUBTITLE:
-                extracted_folder = self._subtitle_extractor.extract_archived_subtitle(
-                    subtitle=subtitle_struct, metadata=metadata
-                )
+                if extracted_folder is None:
+                    extracted_folder = (
+                        self._subtitle_extractor.extract_archived_subtitle(
+                            subtitle=subtitle_struct, metadata=metadata
+                        )
+                    )
                 subtitle_files = self._get_subtitles_from_folder(
                     folder=extracted_folder
                 )
@@ -136,6 +141,36 @@ class GeneralRestructor(Restructor):
 
         return self._convert_subtitle(subtitle_files=subtitle_files)
 
+    # archive extraction is bound by subprocess and disk I/O, so run it in threads
+    def _extract_archived_subtitles(
+        self, subtitles: List[Structable], metadata: Metadata
+    ) -> Dict[int, Folder]:
+        archived_subtitles = [
+            subtitle
+            for subtitle in subtitles
+            if isinstance(subtitle, File)
+            and subtitle.get_file_type() == FileType.ARCHIVED_SUBTITLE
+        ]
+
+        extracted_folders = {}
+        if len(archived_subtitles) <= 1:
+            return extracted_folders
+
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            futures = {
+                executor.submit(
+                    self._subtitle_extractor.extract_archived_subtitle,
+                    subtitle=subtitle,
+                    metadata=metadata,
+                ): subtitle
+                for subtitle in archived_subtitles
+            }
+
+            for future in as_completed(futures):
+                extracted_folders[id(futures[future])] = future.result()
+
+        return extracted_folders
+
     def _convert_subtitle(self, subtitle_files: List[File]) -> List[File]:
         if not self._env_configs._CONVERT_SMI_TO_SRT:
             return subtitle_files
@@ -424,9 +459,15 @@ class TVRestructor(GeneralRestructor):
 
             subtitle_files = []
 
+            extracted_folders = self._extract_archived_subtitles(
+                subtitles=subtitles, metadata=metadata
+            )
+
             for subtitle in subtitles:
                 extracted_subtitle_files = self._get_subtitle_files(
-                    subtitle_struct=subtitle, metadata=metadata
+                    subtitle_struct=subtitle,
+                    metadata=metadata,
+                    extracted_folder=extracted_folders.get(id(subtitle)),
                 )
                 original_subtitle_files.append(subtitle)
                 subtitle_files.extend(extracted_subtitle_files)
@@ -507,21 +548,22 @@ class TVRestructor(GeneralRestructor):
     def _organaize_subtitles_by_episode(self, subtitle_files: List[File]) -> Dict:
         subtitles_by_episode = {}
 
+        subtitle_titles = [
+            subtitle_file.get_title() for subtitle_file in subtitle_files
+        ]
         subtitle_files_prefix = self._subtitle_analyzer._get_file_name_prefix(
-            files=subtitle_files
+            file_names=subtitle_titles
+        )
+        episode_index_pattern = self._subtitle_analyzer._compile_episode_index_pattern(
+            prefix=subtitle_files_prefix
         )
 
-        for subtitle_file in subtitle_files:
-            episode_index = (
-                self._subtitle_analyzer._extract_episode_index_from_file_name(
-                    file_name=subtitle_file.get_title(), prefix=subtitle_files_prefix
-                )
+        for subtitle_title, subtitle_file in zip(subtitle_titles, subtitle_files):
+            episode_index = self._subtitle_analyzer._match_episode_index(
+                file_name=subtitle_title, pattern=episode_index_pattern
             )
 
-            if subtitles_by_episode.get(episode_index):
-                subtitles_by_episode[episode_index].append(subtitle_file)
-            else:
-                subtitles_by_episode[episode_index] = [subtitle_file]
+            subtitles_by_episode.setdefault(episode_index, []).append(subtitle_file)
 
         return subtitles_by_episode
 
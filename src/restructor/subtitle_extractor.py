@@ -1,4 +1,5 @@
 import tempfile
+from collections import deque
 from abc import ABCMeta
 from patoolib import extract_archive
 from typing import List
@@ -26,16 +27,24 @@ class SubtitleExtractor(metaclass=ABCMeta):
     def extract_archived_subtitle(self, subtitle: File, metadata: Metadata) -> Folder:
         raise NotImplementedError
 
+    def close(self) -> None:
+        raise NotImplementedError
+
 
 class GeneralSubtitleExtractor(SubtitleExtractor):
     def __init__(self, constrcutor: Constructor) -> None:
         self._constrcutor = constrcutor
+        # every archive is extracted under this directory, removed on close or exit
+        self._temp_root = tempfile.TemporaryDirectory()
+
+    def close(self) -> None:
+        self._temp_root.cleanup()
 
     def extract_archived_subtitle(self, subtitle: File, metadata: Metadata) -> Folder:
         if subtitle.get_file_type() != FileType.ARCHIVED_SUBTITLE:
             raise InvalidMediaTypeException
 
-        temp_extracted_subtitle_path = tempfile.mkdtemp()
+        temp_extracted_subtitle_path = tempfile.mkdtemp(dir=self._temp_root.name)
 
         extract_archive(
             archive=subtitle.get_absolute_path(),
@@ -51,11 +60,14 @@ class GeneralSubtitleExtractor(SubtitleExtractor):
 
     # find subtitles in extracted folder
     def _find_subtitle_containing_folder(self, root: Folder) -> Folder:
-        if root.contains_subtitle_file():
-            return root
+        folders = deque([root])
+
+        while folders:
+            folder = folders.popleft()
+            if folder.contains_subtitle_file():
+                return folder
 
-        for child in root.get_folders():
-            return self._find_subtitle_containing_folder(root=child)
+            folders.extend(folder.get_folders())
 
         raise NoSubtitleFileException(
             f"Subtitle archive extracted, but no subtitle found. (extracted_path={root.get_absolute_path()})"